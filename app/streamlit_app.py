@@ -9,8 +9,7 @@ if PROJECT_ROOT not in sys.path:
 
 import streamlit as st
 import pandas as pd
-from src.parse_resumes import parse_multiple_resumes
-from src.screening import screen_candidates
+from src.screening import ScreeningSession
 
 # Optional export placeholders (should accept demo_mode parameter)
 from src.google_sheets_utils import export_to_google_sheets
@@ -29,6 +28,10 @@ required_years = st.sidebar.number_input(
     min_value=0, max_value=50, value=2
 )
 
+phone_region = st.sidebar.text_input(
+    "Default phone region (ISO code)", value="IN", max_chars=2
+).strip().upper() or "IN"
+
 # Demo mode toggle (important when free tiers are exhausted)
 demo_mode = st.sidebar.checkbox("Demo mode (use local mocks & local exports)", value=True)
 
@@ -66,6 +69,9 @@ if "results_df" not in st.session_state:
     st.session_state["results_df"] = None
 if "jd_keywords" not in st.session_state:
     st.session_state["jd_keywords"] = None
+# Incremental session: only new uploads are parsed/scored on re-process
+if "screening_session" not in st.session_state or st.session_state["screening_session"].region != phone_region:
+    st.session_state["screening_session"] = ScreeningSession(region=phone_region)
 
 # Processing block: run when user clicks Process Resumes
 if process_btn:
@@ -75,16 +81,16 @@ if process_btn:
         st.error("❌ Please paste the Job Description.")
     else:
         with st.spinner("Processing resumes..."):
-            parsed_resumes = parse_multiple_resumes(uploaded_files)
-
-            results, jd_keywords = screen_candidates(
-                parsed_resumes,
+            session = st.session_state["screening_session"]
+            results, jd_keywords = session.update(
+                uploaded_files,
                 jd_text,
                 required_exp=required_years,
                 use_openai=use_openai,
                 cache_enabled=True,
                 demo_mode=demo_mode  # pass demo_mode so explanations are mocked when demo_mode=True
             )
+            parsed_resumes = session.parsed_resumes
 
         # Save processed outputs into session_state so export buttons won't force re-processing
         st.session_state["parsed_resumes"] = parsed_resumes
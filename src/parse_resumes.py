@@ -4,6 +4,7 @@
 
 import io
 import re
+from functools import partial
 import pdfplumber
 import docx
 from email_validator import validate_email, EmailNotValidError
@@ -33,9 +34,37 @@ def extract_text_docx_bytes(file_bytes):
         except Exception:
             return ""
 
+# Precompiled patterns shared by the single-resume helpers and the batch pass.
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_YEARS_RE = re.compile(r"(\d{1,2})\+?\s+years")
+_YEAR_RANGE_RE = re.compile(r"(\b19\d{2}|\b20\d{2})\s*[-to]{1,3}\s*(\b19\d{2}|\b20\d{2})")
+# separators PhoneNumberMatcher accepts inside a number (mirrors
+# phonenumbers' VALID_PUNCTUATION: unicode dashes, slashes, tildes, brackets...)
+_PHONE_SEPARATORS = (
+    "\\-xX\u2010-\u2015\u2212\u30fc\uff0d-\uff0f \u00a0\u00ad\u200b\u2060\u3000"
+    "()\uff08\uff09\uff3b\uff3d.\\[\\]/~\u2053\u223c\uff5e"
+)
+# cheap pre-filter: a run of at least 7 digits mixed with phone separators;
+# leading "+" / "(" are picked up by the window padding below
+_PHONE_CANDIDATE_RE = re.compile(r"\d[\d\s" + _PHONE_SEPARATORS + r"]{5,}\d")
+_MIN_PHONE_DIGITS = 7
+# context kept around each candidate so the matcher can still see neighbouring
+# letters (IDs, versions) and trailing extensions such as "ext. 123"
+_PHONE_WINDOW_PAD = 16
+
+# small default skill lexicon — extend as needed
+SKILL_KEYWORDS = [
+    "python","java","c++","c#","javascript","react","node","django","flask",
+    "sql","mysql","postgresql","mongodb","docker","kubernetes","aws","azure","gcp",
+    "machine learning","nlp","deep learning","pandas","numpy","scikit-learn",
+    "tensorflow","pytorch","excel","tableau","power bi","git","github"
+]
+
+DEFAULT_REGION = "IN"
+
 def extract_emails(text):
     emails = []
-    for match in re.findall(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text):
+    for match in _EMAIL_RE.findall(text or ""):
         try:
             valid = validate_email(match)
             emails.append(valid.email)
@@ -43,38 +72,47 @@ def extract_emails(text):
             continue
     return list(dict.fromkeys(emails))
 
-def extract_phone_numbers(text, region="IN"):
+def _phone_candidate_windows(text):
+    # yield only the spans that could hold a phone number, so the (slow)
+    # PhoneNumberMatcher never has to walk the full resume text
+    start = end = None
+    for m in _PHONE_CANDIDATE_RE.finditer(text):
+        if sum(ch.isdigit() for ch in m.group(0)) < _MIN_PHONE_DIGITS:
+            continue
+        lo = max(0, m.start() - _PHONE_WINDOW_PAD)
+        hi = min(len(text), m.end() + _PHONE_WINDOW_PAD)
+        if start is not None and lo <= end:
+            # overlapping windows are merged so no candidate is split
+            end = max(end, hi)
+            continue
+        if start is not None:
+            yield text[start:end]
+        start, end = lo, hi
+    if start is not None:
+        yield text[start:end]
+
+def extract_phone_numbers(text, region=DEFAULT_REGION):
     phones = []
     try:
-        for m in phonenumbers.PhoneNumberMatcher(text, region):
-            phones.append(phonenumbers.format_number(m.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL))
+        for window in _phone_candidate_windows(text or ""):
+            for m in phonenumbers.PhoneNumberMatcher(window, region):
+                phones.append(phonenumbers.format_number(m.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL))
     except Exception:
         pass
     return list(dict.fromkeys(phones))
 
-def extract_skills(text):
-    # small default skill lexicon — extend as needed
-    skill_keywords = [
-        "python","java","c++","c#","javascript","react","node","django","flask",
-        "sql","mysql","postgresql","mongodb","docker","kubernetes","aws","azure","gcp",
-        "machine learning","nlp","deep learning","pandas","numpy","scikit-learn",
-        "tensorflow","pytorch","excel","tableau","power bi","git","github"
-    ]
-    s = (text or "").lower()
-    found = [k for k in skill_keywords if k in s]
+def _match_skills(lowered):
+    found = [k for k in SKILL_KEYWORDS if k in lowered]
     return list(dict.fromkeys(found))
 
-def extract_years_of_experience(text):
-    # try "X years" and date ranges
-    if not text:
-        return None
-    m = re.search(r"(\d{1,2})\+?\s+years", text.lower())
+def _match_years(text, lowered):
+    m = _YEARS_RE.search(lowered)
     if m:
         try:
             return int(m.group(1))
         except:
             pass
-    ranges = re.findall(r"(\b19\d{2}|\b20\d{2})\s*[-to]{1,3}\s*(\b19\d{2}|\b20\d{2})", text)
+    ranges = _YEAR_RANGE_RE.findall(text)
     if ranges:
         diffs = []
         for s,e in ranges:
@@ -86,10 +124,54 @@ def extract_years_of_experience(text):
             return max(diffs)
     return None
 
-def parse_resume(uploaded_file):
+def extract_skills(text):
+    return _match_skills((text or "").lower())
+
+def extract_years_of_experience(text):
+    # try "X years" and date ranges
+    if not text:
+        return None
+    return _match_years(text, text.lower())
+
+def extract_fields(text, region=DEFAULT_REGION):
+    """
+    Combined extraction pass over one resume text (lower-cased once and
+    shared by the skill and experience scans).
+    returns dict with keys: emails, phones, skills, years_experience
+    """
+    text = text or ""
+    lowered = text.lower()
+    return {
+        "emails": extract_emails(text),
+        "phones": extract_phone_numbers(text, region),
+        "skills": _match_skills(lowered),
+        "years_experience": _match_years(text, lowered) if text else None
+    }
+
+def _extract_fields_safe(text, region=DEFAULT_REGION):
+    # batch worker: one bad text yields an error marker instead of failing the batch
+    try:
+        return extract_fields(text, region)
+    except Exception as e:
+        return {"error": str(e)}
+
+def extract_fields_batch(texts, region=DEFAULT_REGION, pool=None):
+    """
+    Runs extract_fields over a list of texts.
+    pool: optional executor / multiprocessing pool exposing .map();
+    runs in-process when not given.
+    returns list of field dicts, in the same order as texts; a text whose
+    extraction failed gets {"error": message} instead
+    """
+    worker = partial(_extract_fields_safe, region=region)
+    if pool is None:
+        return [worker(t) for t in texts]
+    return list(pool.map(worker, texts))
+
+def _read_resume_text(uploaded_file):
     """
     uploaded_file: Streamlit UploadedFile (has .name and .read())
-    returns dict with keys: path, text, name, emails, phones, skills, years_experience
+    returns (name, text)
     """
     name = getattr(uploaded_file, "name", "unknown")
     try:
@@ -110,41 +192,68 @@ def parse_resume(uploaded_file):
             text = data.decode("utf-8", errors="ignore")
         except Exception:
             text = ""
+    return name, text
 
-    emails = extract_emails(text)
-    phones = extract_phone_numbers(text)
-    skills = extract_skills(text)
-    years = extract_years_of_experience(text)
-
+def _build_record(name, text, fields):
     return {
         "path": name,
         "text": text,
         "name": name.rsplit(".", 1)[0],
-        "emails": emails,
-        "phones": phones,
-        "skills": skills,
-        "years_experience": years
+        "emails": fields["emails"],
+        "phones": fields["phones"],
+        "skills": fields["skills"],
+        "years_experience": fields["years_experience"]
     }
 
-def parse_multiple_resumes(uploaded_files):
+def error_record(uploaded_file, error):
+    """
+    Minimal record for a file that could not be read or parsed.
+    returns dict with the parse_resume keys plus "error"
+    """
+    return {
+        "path": getattr(uploaded_file, "name", "unknown"),
+        "text": "",
+        "name": getattr(uploaded_file, "name", "unknown"),
+        "emails": [],
+        "phones": [],
+        "skills": [],
+        "years_experience": None,
+        "error": str(error)
+    }
+
+def parse_resume(uploaded_file, region=DEFAULT_REGION):
+    """
+    uploaded_file: Streamlit UploadedFile (has .name and .read())
+    returns dict with keys: path, text, name, emails, phones, skills, years_experience
+    """
+    name, text = _read_resume_text(uploaded_file)
+    return _build_record(name, text, extract_fields(text, region))
+
+def parse_multiple_resumes(uploaded_files, region=DEFAULT_REGION, pool=None):
     """
     uploaded_files: list of uploaded file objects (Streamlit's uploader returns such)
-    returns list of parsed resume dicts
+    region: default phone-number region passed to phonenumbers
+    pool: optional executor / pool for the field extraction pass (see extract_fields_batch)
+    returns list of parsed resume dicts; a file that cannot be read or extracted
+    gets an error record. Failures of the pool itself (e.g. pickling) propagate.
     """
-    parsed = []
+    # read every file first, then run the field extraction over all texts in one batch
+    slots = []
     for f in uploaded_files:
         try:
-            parsed.append(parse_resume(f))
+            slots.append(_read_resume_text(f))
         except Exception as e:
             # continue but include an entry with minimal info
-            parsed.append({
-                "path": getattr(f, "name", "unknown"),
-                "text": "",
-                "name": getattr(f, "name", "unknown"),
-                "emails": [],
-                "phones": [],
-                "skills": [],
-                "years_experience": None,
-                "error": str(e)
-            })
+            slots.append(error_record(f, e))
+
+    pending = [i for i, s in enumerate(slots) if isinstance(s, tuple)]
+    fields = extract_fields_batch([slots[i][1] for i in pending], region=region, pool=pool)
+
+    parsed = list(slots)
+    for i, f in zip(pending, fields):
+        name, text = slots[i]
+        if "error" in f:
+            parsed[i] = error_record(uploaded_files[i], f["error"])
+        else:
+            parsed[i] = _build_record(name, text, f)
     return parsed
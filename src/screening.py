@@ -2,11 +2,13 @@
 import os
 import json
 import hashlib
+import bisect
 import numpy as np
 from threading import Lock
 
 # LangChain usage
 from src.langchain_utils import split_text_with_langchain
+from src.parse_resumes import parse_multiple_resumes, error_record, DEFAULT_REGION
 
 # Optional OpenAI
 try:
@@ -103,8 +105,12 @@ def compute_similarities_faiss(resume_vecs, jd_vec):
     index.add(resume_matrix)
 
     jd_query = jd_vec.reshape(1, -1).astype(np.float32)
-    distances, _ = index.search(jd_query, len(resume_vecs))
-    return distances[0]
+    distances, indices = index.search(jd_query, len(resume_vecs))
+
+    # search returns hits ranked by score; map them back to input order
+    sims = np.zeros(len(resume_vecs), dtype=np.float32)
+    sims[indices[0]] = distances[0]
+    return sims
 
 ###########################################################################
 # EXPLANATIONS
@@ -158,6 +164,71 @@ def local_explanation(resume_text, jd_text, score):
 
     return "\n".join(bullets)
 
+###########################################################################
+# SCORING
+###########################################################################
+
+
+def extract_jd_keywords(jd_text):
+    return [w.lower().strip(".,:;()") for w in jd_text.split() if len(w) > 4]
+
+
+def compute_similarities(resume_vecs, jd_vec):
+    if not resume_vecs:
+        return []
+
+    # FAISS or fallback
+    sims = None
+    if _HAS_FAISS:
+        try:
+            sims = compute_similarities_faiss(resume_vecs, jd_vec)
+        except:
+            sims = None
+
+    if sims is None:
+        sims = [cosine_similarity_numpy(v, jd_vec) for v in resume_vecs]
+    return sims
+
+
+def score_resume(r, resume_text, similarity, jd_text, jd_keywords, cache,
+                 use_openai=False, cache_enabled=True, demo_mode=True):
+    filename = r.get("path") or r.get("name") or r.get("filename") or "Unknown"
+
+    similarity = float(similarity)
+    keyword_matches = sum(1 for w in jd_keywords if w in resume_text.lower())
+
+    # Normalize scores → percentage
+    sim_norm = (similarity + 1) / 2
+    max_kw = max(1, len(jd_keywords))
+    keyword_score = min(1.0, keyword_matches / max_kw)
+
+    final_score_float = sim_norm * 0.7 + keyword_score * 0.3
+    match_percentage = int(round(final_score_float * 100))
+
+    # Explanation
+    if use_openai and not demo_mode:
+        ck = _make_cache_key(resume_text, jd_text)
+        if cache_enabled and ck in cache:
+            explanation = cache[ck]
+        else:
+            explanation = explain_with_openai(resume_text, jd_text, similarity)
+            cache[ck] = explanation
+            _save_cache(cache)
+    else:
+        explanation = local_explanation(resume_text, jd_text, similarity)
+
+    return {
+        "filename": filename,
+        "path": r.get("path"),
+        "name": r.get("name"),
+        "similarity": round(similarity, 3),
+        "keyword_matches": keyword_matches,
+        "final_score": round(final_score_float, 3),
+        "match_percentage": match_percentage,
+        "explanation": explanation,
+        "resume_text": resume_text
+    }
+
 ###########################################################################
 # MAIN: screen_candidates
 ###########################################################################
@@ -169,7 +240,7 @@ def screen_candidates(resumes, jd_text, required_exp=0, use_openai=False, cache_
     _ = split_text_with_langchain(jd_text)
 
     results = []
-    jd_keywords = [w.lower().strip(".,:;()") for w in jd_text.split() if len(w) > 4]
+    jd_keywords = extract_jd_keywords(jd_text)
 
     cache = _load_cache() if cache_enabled else {}
 
@@ -182,58 +253,193 @@ def screen_candidates(resumes, jd_text, required_exp=0, use_openai=False, cache_
         resume_vecs.append(text_to_mock_vector(txt))
 
     jd_vec = text_to_mock_vector(jd_text)
-
-    # FAISS or fallback
-    sims = None
-    if _HAS_FAISS:
-        try:
-            sims = compute_similarities_faiss(resume_vecs, jd_vec)
-        except:
-            sims = None
-
-    if sims is None:
-        sims = [cosine_similarity_numpy(v, jd_vec) for v in resume_vecs]
+    sims = compute_similarities(resume_vecs, jd_vec)
 
     # Build results
     for i, r in enumerate(resumes):
-        resume_text = resume_texts[i]
-        filename = r.get("path") or r.get("name") or r.get("filename") or "Unknown"
+        results.append(score_resume(
+            r, resume_texts[i], sims[i], jd_text, jd_keywords, cache,
+            use_openai=use_openai, cache_enabled=cache_enabled, demo_mode=demo_mode
+        ))
 
-        similarity = float(sims[i])
-        keyword_matches = sum(1 for w in jd_keywords if w in resume_text.lower())
+    # Sort by percentage
+    results = sorted(results, key=lambda x: x["match_percentage"], reverse=True)
+    return results, jd_keywords
 
-        # Normalize scores → percentage
-        sim_norm = (similarity + 1) / 2
-        max_kw = max(1, len(jd_keywords))
-        keyword_score = min(1.0, keyword_matches / max_kw)
+###########################################################################
+# INCREMENTAL SESSION
+###########################################################################
 
-        final_score_float = sim_norm * 0.7 + keyword_score * 0.3
-        match_percentage = int(round(final_score_float * 100))
 
-        # Explanation
-        if use_openai and not demo_mode:
-            ck = _make_cache_key(resume_text, jd_text)
-            if cache_enabled and ck in cache:
-                explanation = cache[ck]
+class _UploadedBytes:
+    # minimal stand-in for a Streamlit UploadedFile once its bytes are read
+    def __init__(self, name, data):
+        self.name = name
+        self._data = data
+
+    def read(self):
+        return self._data
+
+
+def _read_upload_bytes(uploaded_file):
+    getvalue = getattr(uploaded_file, "getvalue", None)
+    if getvalue is not None:
+        return getvalue()
+    data = uploaded_file.read()
+    if hasattr(uploaded_file, "seek"):
+        uploaded_file.seek(0)
+    return data
+
+
+def _content_hash(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data or b"").hexdigest()
+
+
+class ScreeningSession:
+    """
+    Remembers parsed records, vectors and scores for the current JD, keyed by
+    resume content hash. Each update() only parses and scores new uploads,
+    drops removed ones, and merges new ones into the ranking by sorted insert.
+    Changing the JD (or the explanation settings) rescores the cached
+    records without re-parsing them. Results match screen_candidates over
+    the same upload list, ties included.
+    """
+
+    def __init__(self, region=DEFAULT_REGION, pool=None):
+        self.region = region
+        self.pool = pool
+        self.jd_keywords = []
+        self._records = {}   # hash -> parsed resume dict
+        self._vectors = {}   # hash -> resume vector
+        self._scores = {}    # hash -> component scores for the current JD
+        self._current = []   # upload slots (name, hash, n) in current upload order
+        self._ranking = []   # slots sorted by match_percentage desc, then upload position
+        self._rank_keys = []
+        self._jd_state = None
+        self._jd_vec = None
+
+    @property
+    def results(self):
+        return [self._result(slot) for slot in self._ranking]
+
+    @property
+    def parsed_resumes(self):
+        return [self._record(slot) for slot in self._current]
+
+    def update(self, uploaded_files, jd_text, required_exp=0, use_openai=False, cache_enabled=True, demo_mode=True):
+        """
+        uploaded_files: the full current upload list (Streamlit UploadedFile objects)
+        returns (results, jd_keywords) like screen_candidates
+        """
+        slots = []
+        seen = {}
+        new = {}
+        for f in uploaded_files:
+            name = getattr(f, "name", "unknown")
+            try:
+                data = _read_upload_bytes(f)
+                h = _content_hash(data)
+            except Exception as e:
+                # unreadable upload: keyed by name, retried on the next update
+                h = "error:" + name
+                self._records[h] = error_record(f, e)
+                self._vectors[h] = text_to_mock_vector("")
+                self._scores.pop(h, None)
             else:
-                explanation = explain_with_openai(resume_text, jd_text, similarity)
-                cache[ck] = explanation
-                _save_cache(cache)
-        else:
-            explanation = local_explanation(resume_text, jd_text, similarity)
-
-        results.append({
-            "filename": filename,
-            "path": r.get("path"),
-            "name": r.get("name"),
-            "similarity": round(similarity, 3),
-            "keyword_matches": keyword_matches,
-            "final_score": round(final_score_float, 3),
-            "match_percentage": match_percentage,
-            "explanation": explanation,
-            "resume_text": resume_text
-        })
-
-    # Sort by percentage
-    results = sorted(results, key=lambda x: x["match_percentage"], reverse=True)
-    return results, jd_keywords
+                if h not in self._records and h not in new:
+                    new[h] = _UploadedBytes(name, data)
+            # identical (name, bytes) uploads stay separate rows, as in screen_candidates
+            n = seen.get((name, h), 0)
+            seen[(name, h)] = n + 1
+            slots.append((name, h, n))
+
+        old_slots = self._current
+        self._current = slots
+        live = set(h for _, h, _ in slots)
+        for h in list(self._records):
+            if h not in live and h not in new:
+                self._records.pop(h, None)
+                self._vectors.pop(h, None)
+                self._scores.pop(h, None)
+
+        if new:
+            hashes = list(new)
+            parsed = parse_multiple_resumes([new[h] for h in hashes], region=self.region, pool=self.pool)
+            for h, r in zip(hashes, parsed):
+                self._records[h] = r
+                self._vectors[h] = text_to_mock_vector(r.get("text", "") or "")
+
+        jd_state = (jd_text, use_openai, cache_enabled, demo_mode)
+        if jd_state != self._jd_state:
+            self._reset_jd(jd_text)
+            self._jd_state = jd_state
+
+        pending = list(dict.fromkeys(h for _, h, _ in slots if h not in self._scores))
+        if pending:
+            self._score(pending, jd_text, use_openai, cache_enabled, demo_mode)
+
+        self._rerank(old_slots)
+        return self.results, self.jd_keywords
+
+    def _record(self, slot):
+        # cached record with the identity of the current upload
+        name, h, _ = slot
+        r = dict(self._records[h])
+        r["path"] = name
+        r["name"] = name if "error" in r else name.rsplit(".", 1)[0]
+        return r
+
+    def _result(self, slot):
+        r = self._record(slot)
+        result = dict(self._scores[slot[1]])
+        result["filename"] = r.get("path") or r.get("name") or r.get("filename") or "Unknown"
+        result["path"] = r.get("path")
+        result["name"] = r.get("name")
+        return result
+
+    def _reset_jd(self, jd_text):
+        # LangChain call (satisfies requirement)
+        _ = split_text_with_langchain(jd_text)
+        self.jd_keywords = extract_jd_keywords(jd_text)
+        self._jd_vec = text_to_mock_vector(jd_text)
+        self._scores = {}
+
+    def _score(self, hashes, jd_text, use_openai, cache_enabled, demo_mode):
+        cache = _load_cache() if cache_enabled else {}
+        sims = compute_similarities([self._vectors[h] for h in hashes], self._jd_vec)
+        for h, sim in zip(hashes, sims):
+            r = self._records[h]
+            self._scores[h] = score_resume(
+                r, r.get("text", "") or "", sim, jd_text, self.jd_keywords, cache,
+                use_openai=use_openai, cache_enabled=cache_enabled, demo_mode=demo_mode
+            )
+
+    def _rerank(self, old_slots):
+        pos = {slot: i for i, slot in enumerate(self._current)}
+
+        def key(slot):
+            return (-self._scores[slot[1]]["match_percentage"], pos[slot])
+
+        # sorted insert is only valid while surviving slots keep their scores
+        # and relative upload order; otherwise re-sort the cached scores
+        ranked = set(self._ranking)
+        kept = [slot for slot in old_slots if slot in pos and slot in ranked]
+        kept_set = set(kept)
+        if [slot for slot in self._current if slot in kept_set] != kept or \
+                any(self._rank_keys[i][0] != -self._scores[slot[1]]["match_percentage"]
+                    for i, slot in enumerate(self._ranking) if slot in kept_set):
+            self._ranking = sorted(self._current, key=key)
+            self._rank_keys = [key(slot) for slot in self._ranking]
+            return
+
+        self._ranking = [slot for slot in self._ranking if slot in kept_set]
+        self._rank_keys = [key(slot) for slot in self._ranking]
+        for slot in self._current:
+            if slot in kept_set:
+                continue
+            k = key(slot)
+            idx = bisect.bisect(self._rank_keys, k)
+            self._rank_keys.insert(idx, k)
+            self._ranking.insert(idx, slot)
@@ -0,0 +1,74 @@
+# tests/test_parse_resumes.py
+# Parity check: the windowed phone pass must agree with running
+# PhoneNumberMatcher over the full text.
+
+import random
+import pytest
+
+phonenumbers = pytest.importorskip("phonenumbers")
+pytest.importorskip("pdfplumber")
+pytest.importorskip("docx")
+pytest.importorskip("email_validator")
+
+from src.parse_resumes import extract_phone_numbers, extract_fields_batch
+
+SEPARATORS = [
+    " ", "-", ".", "/", "~", " ", "‐", "‑", "‒", "–", "—",
+    "―", "−", "ー", "－", "／", "～", "∼", "⁓",
+    " – ", " / ", " - ", "　", "",
+]
+NUMBERS = [
+    "98765{s}43210",
+    "+91{s}98765{s}43210",
+    "(080){s}2345{s}6789",
+    "022{s}2345{s}6789",
+    "+1{s}650{s}253{s}0000",
+    "+1 650{s}253{s}0000 ext. 123",
+    "+44{s}20{s}7946{s}0958",
+]
+CONTEXTS = [
+    "{}",
+    "Mobile: {}",
+    "Phone: {} | Email: a@b.com",
+    "Ref: ABC{}XYZ",
+    "order#{}x",
+    "Worked 2015 - 2019, call {} after 5pm",
+    "v2.3.{}",
+]
+
+
+def _full_text(text, region):
+    found = []
+    for m in phonenumbers.PhoneNumberMatcher(text, region):
+        found.append(phonenumbers.format_number(m.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL))
+    return list(dict.fromkeys(found))
+
+
+def _corpus():
+    texts = []
+    for s in SEPARATORS:
+        for n in NUMBERS:
+            for c in CONTEXTS:
+                texts.append(c.format(n.format(s=s)))
+    rng = random.Random(7)
+    tokens = ["Phone:", "+91", "98765", "43210", "ext.", "12", "ID", "AB", "2015", "2019",
+              "v1.2", "(080)", "2345", "6789", "tel", "9876543210", "\n", "+1", "650", "253",
+              "0000", "years", "python"] + SEPARATORS
+    for _ in range(500):
+        texts.append("".join(rng.choice(tokens) + rng.choice(["", " ", "-", "–"]) for _ in range(30)))
+    return texts
+
+
+@pytest.mark.parametrize("region", ["IN", "US"])
+def test_phone_windows_match_full_text(region):
+    mismatches = [t for t in _corpus() if extract_phone_numbers(t, region) != _full_text(t, region)]
+    assert mismatches == []
+
+
+def test_batch_reports_per_text_errors():
+    fields = extract_fields_batch(["Mobile: 98765–43210, 3 years python", 42, ""])
+    assert fields[0]["phones"] == ["+91 98765 43210"]
+    assert fields[0]["skills"] == ["python"]
+    assert fields[0]["years_experience"] == 3
+    assert "error" in fields[1]
+    assert fields[2]["years_experience"] is None